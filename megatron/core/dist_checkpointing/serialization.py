@@ -371,6 +371,8 @@ def save(
     Returns:
         AsyncRequest (optional): if `async_sharded_save` is True, returns
             async request that should be scheduled by the caller of this function.
+            If the sharded strategy has `deferred_flush` set, returns an async
+            request that the caller must schedule with `schedule_deferred_save`.
             None otherwise.
     """
     if torch.distributed.get_rank() == 0:
@@ -386,9 +388,6 @@ def save(
             if torch.distributed.get_rank() == 0:
                 logger.warning("Overwriting old incomplete / corrupted checkpoint...")
 
-    if common_strategy is not None:
-        raise NotImplementedError('The only supported common strategy is torch')
-
     if sharded_strategy is None:
         sharded_strategy = get_default_save_sharded_strategy()
     if not isinstance(sharded_strategy, SaveShardedStrategy):
@@ -400,6 +399,8 @@ def save(
     if not isinstance(common_strategy, SaveCommonStrategy):
         assert isinstance(common_strategy, tuple), type(common_strategy)
         common_strategy = get_default_strategy(StrategyAction.SAVE_COMMON, *common_strategy)
+    if common_strategy.backend != 'torch':
+        raise NotImplementedError('The only supported common strategy backend is torch')
 
     if content_metadata is not None:
         sharded_state_dict[_CONTENT_METADATA_KEY] = content_metadata
@@ -426,6 +427,16 @@ def save(
         torch.distributed.barrier()
 
     if not async_sharded_save:
+        if getattr(sharded_strategy, 'deferred_flush', False):
+            # Overlap the flush with subsequent training: the write is performed
+            # in the background and the completion marker rides in the request
+            # finalization, so it is written only once the checkpoint data is
+            # fully persisted. The request is returned (as for async saves) so
+            # the caller can append its own finalizations (e.g. a checkpoint
+            # tracker update) before scheduling it with `schedule_deferred_save`.
+            async_request = sharded_strategy.async_save(sharded_state_dict, checkpoint_dir)
+            async_request.finalize_fns.append(metadata_finalize_fn)
+            return async_request
         sharded_strategy.save(sharded_state_dict, checkpoint_dir)
         metadata_finalize_fn()
         return None
@@ -9,6 +9,7 @@ import logging
 from abc import ABC, abstractmethod
 from collections import deque
 from contextlib import contextmanager
+from functools import partial
 from queue import Empty
 from time import sleep, time
 from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
@@ -112,6 +113,125 @@ class AsyncRequest(NamedTuple):
         return self._replace(is_frozen=True)
 
 
+class PinnedStager:
+    """Stages GPU tensors to pinned host memory on a dedicated CUDA stream.
+
+    Pinned buffers keep the D2H memcpy truly asynchronous and running at full
+    PCIe bandwidth, while the side stream lets the copies overlap with work
+    still executing on the current stream (e.g. the next training iteration).
+    Buffers are allocated with `pin_memory=True`, so repeated allocations of the
+    same sizes are served from PyTorch's caching host allocator.
+    """
+
+    def __init__(self):
+        self._stream: Optional[torch.cuda.Stream] = (
+            torch.cuda.Stream() if torch.cuda.is_available() else None
+        )
+
+    def stage(self, tensor: torch.Tensor, non_blocking: bool = True) -> torch.Tensor:
+        """Returns a host copy of `tensor`.
+
+        CUDA tensors are copied into a pinned host buffer on the staging stream.
+        CPU tensors are snapshotted with a clone: `Tensor.to('cpu')` is a no-op
+        alias for them, which would let the training loop mutate the data (e.g.
+        an optimizer step on CPU params) while the async write is still in
+        flight and corrupt the checkpoint.
+
+        Args:
+            tensor (torch.Tensor): tensor to stage to host memory.
+            non_blocking (bool, optional): knob to enable async D2H memcpy.
+                Default is True.
+        """
+        if tensor.device.type == 'cpu':
+            return tensor.clone()
+        if tensor.device.type != 'cuda' or self._stream is None:
+            return tensor.to('cpu', non_blocking=non_blocking)
+        host_buffer = torch.empty_like(tensor, device='cpu', pin_memory=True)
+        self._stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(self._stream):
+            host_buffer.copy_(tensor, non_blocking=non_blocking)
+        return host_buffer
+
+    def synchronize(self) -> None:
+        """Waits until all staging copies issued so far are complete."""
+        if self._stream is not None:
+            self._stream.synchronize()
+
+
+_pinned_stager: Optional[PinnedStager] = None
+
+
+def get_pinned_stager() -> PinnedStager:
+    """Returns the per-process `PinnedStager` instance (created lazily)."""
+    global _pinned_stager
+    if _pinned_stager is None:
+        _pinned_stager = PinnedStager()
+    return _pinned_stager
+
+
+def _preload_batched_requests(preload_fns: List[Optional[Callable]], default_staged_args: List):
+    """Run `preload_fn` of each merged request; requests without one keep their args."""
+    return [
+        preload_fn() if preload_fn is not None else staged
+        for preload_fn, staged in zip(preload_fns, default_staged_args)
+    ]
+
+
+def _execute_batched_async_fns(
+    async_fns: List[Callable], staged_args: List, args_and_kwargs: List[Tuple[Tuple, Dict]]
+):
+    """Execute `async_fn` of each merged request with its (possibly staged) args."""
+    for async_fn, staged, (args, kwargs) in zip(async_fns, staged_args, args_and_kwargs):
+        args = list(args)
+        if len(args) > 1:
+            # By the `AsyncRequest` convention, the 2nd arg holds the data to persist
+            # and is replaced with the staged tensors (see `AsyncRequest.execute_sync`)
+            args[1] = staged
+        async_fn(*args, **kwargs)
+
+
+def merge_async_requests(async_requests: List[AsyncRequest]) -> AsyncRequest:
+    """Merge multiple async requests into a single one.
+
+    The merged request runs all `async_fn`s (in order) within a single async call
+    and concatenates the finalization functions, so that a batch of requests pays
+    for one async caller and one finalization synchronization instead of one per
+    request.
+
+    Args:
+        async_requests (List[AsyncRequest]): requests to merge. Must be non-empty.
+
+    Returns:
+        AsyncRequest: a single request equivalent to executing all input requests
+            in order.
+    """
+    assert async_requests, 'Cannot merge an empty list of async requests'
+    if len(async_requests) == 1:
+        return async_requests[0]
+    finalize_fns = [fn for req in async_requests for fn in req.finalize_fns]
+    active_requests = [req for req in async_requests if req.async_fn is not None]
+    if not active_requests:
+        return AsyncRequest(None, (), finalize_fns)
+    async_fns = [req.async_fn for req in active_requests]
+    args_and_kwargs = [(req.async_fn_args, req.async_fn_kwargs) for req in active_requests]
+    staged_args = [
+        req.async_fn_args[1] if len(req.async_fn_args) > 1 else None for req in active_requests
+    ]
+    preload_fn = None
+    if any(req.preload_fn is not None for req in active_requests):
+        preload_fn = partial(
+            _preload_batched_requests,
+            [req.preload_fn for req in active_requests],
+            staged_args,
+        )
+    return AsyncRequest(
+        async_fn=_execute_batched_async_fns,
+        async_fn_args=(async_fns, staged_args, args_and_kwargs),
+        finalize_fns=finalize_fns,
+        preload_fn=preload_fn,
+    )
+
+
 class AsyncCaller(ABC):
     """Wrapper around mp.Process that ensures correct semantic of distributed finalization.
 
@@ -555,6 +675,25 @@ class AsyncCallsQueue:
         Args:
             async_request (AsyncRequest): async request to start.
 
+        Returns:
+            int: index of the async call that was started.
+                This can help the user keep track of the async calls.
+        """
+        return self.schedule_async_request_batch([async_request])
+
+    def schedule_async_request_batch(self, async_requests: List[AsyncRequest]) -> int:
+        """Start a batch of async requests as a single async call.
+
+        The requests are merged (see `merge_async_requests`) so that the whole
+        batch shares one async caller and one finalization synchronization,
+        instead of paying the per-request collective overhead when multiple
+        strategies cascade within a single checkpoint save.
+
+        This method must be called on all ranks.
+
+        Args:
+            async_requests (List[AsyncRequest]): async requests to start together.
+
         Returns:
             int: index of the async call that was started.
                 This can help the user keep track of the async calls.
@@ -562,15 +701,35 @@ class AsyncCallsQueue:
         self.call_idx += 1
         async_caller = self._get_async_caller()
         # Backward compatibility for local checkpointing built with the old AsyncRequest
-        if len(async_request._fields) != len(AsyncRequest._fields):
-            async_request = AsyncRequest(**async_request._asdict())
-        async_request = async_request.freeze()
+        async_requests = [
+            AsyncRequest(**req._asdict()) if len(req._fields) != len(AsyncRequest._fields) else req
+            for req in async_requests
+        ]
+        async_request = merge_async_requests(async_requests).freeze()
         async_caller.schedule_async_call(
             async_request._replace(call_idx=self.call_idx, finalize_fns=[])
         )
         self.async_calls.append(_ActiveAsyncRequest(self.call_idx, async_caller, async_request))
         return self.call_idx
 
+    def barrier_previous(self, no_dist=False) -> List[int]:
+        """Block until all previously scheduled async calls are finalized.
+
+        Intended to be called at the start of the next checkpoint save so that
+        the disk write of the previous checkpoint overlaps with the training
+        iterations in between, instead of stalling the step that scheduled it.
+
+        This method must be called on all ranks.
+
+        Args:
+            no_dist (bool, Optional): if True, training ranks simply check its
+                asynchronous checkpoint writer without synchronization.
+
+        Returns:
+            List[int]: list of indices of async calls that have been finalized.
+        """
+        return self.maybe_finalize_async_calls(blocking=True, no_dist=no_dist)
+
     def maybe_finalize_async_calls(self, blocking=False, no_dist=False) -> List[int]:
         """Finalizes all available calls.
 
@@ -2,49 +2,177 @@
 
 """ Strategies base interfaces. """
 
-from abc import ABC, abstractmethod
-from collections import defaultdict
-from enum import Enum
+import copy
+import io
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, DefaultDict, Union
+from types import DynamicClassAttribute
+from typing import Any, Callable, ClassVar, List, Optional, Union
+
+import torch
+
+try:
+    import zstandard
+
+    HAVE_ZSTD = True
+except ImportError:
+    HAVE_ZSTD = False
 
 from ..mapping import CheckpointingException, ShardedStateDict, StateDict
+from ..utils import write_vectored  # re-exported write primitive for save strategies
 from .async_utils import AsyncCallsQueue, AsyncRequest
 
 
-class StrategyAction(Enum):
-    """Specifies save vs load and sharded vs common action."""
+# String forms of StrategyAction members, indexed by the integer member value
+_ACTION_LABELS = ('load_common', 'load_sharded', 'save_common', 'save_sharded')
+
+
+class StrategyAction(IntEnum):
+    """Specifies save vs load and sharded vs common action.
+
+    Members are small consecutive integers so that the strategy registries can
+    be indexed with a flat per-action table instead of hashing a string on
+    every dispatch.
+    """
+
+    LOAD_COMMON = 0
+    LOAD_SHARDED = 1
+    SAVE_COMMON = 2
+    SAVE_SHARDED = 3
+
+    @DynamicClassAttribute
+    def value(self) -> str:
+        """Original string form of the action (kept for API compatibility)."""
+        return _ACTION_LABELS[self._value_]
 
-    LOAD_COMMON = 'load_common'
-    LOAD_SHARDED = 'load_sharded'
-    SAVE_COMMON = 'save_common'
-    SAVE_SHARDED = 'save_sharded'
+    @classmethod
+    def _missing_(cls, value):
+        # Lookup by the original string values, e.g. StrategyAction('load_common')
+        if isinstance(value, str) and value in _ACTION_LABELS:
+            return cls(_ACTION_LABELS.index(value))
+        return None
 
+    def __str__(self) -> str:
+        # Pre-IntEnum string form (IntEnum stringifies to the bare int since py3.11)
+        return f'{self.__class__.__name__}.{self.name}'
 
-default_strategies: DefaultDict[str, dict[tuple, Any]] = defaultdict(dict)
+
+# Per-action registries keyed by (backend, version) and indexed by the integer
+# action value - with 4 fixed actions, array indexing beats hashing
+default_strategies: tuple[dict, dict, dict, dict] = ({}, {}, {}, {})
+
+# Backends whose default strategies registration already ran in this process.
+# Registration is idempotent but not free (imports + strategy construction),
+# so it is performed at most once per backend.
+_registered_backends: set = set()
 
 async_calls = AsyncCallsQueue()
 
 
+def reset_async_calls(persistent: bool = False):
+    """Recreates the module-level async calls queue, releasing its resources.
+
+    Finalizes all pending async calls, terminates the persistent checkpoint
+    worker (if any) and drops the references held to completed requests, so that
+    staged host buffers (potentially GB-scale pinned memory) can be reclaimed
+    between checkpoint rounds.
+
+    Args:
+        persistent (bool, optional): whether the new queue should use a
+            persistent checkpoint worker. Defaults to False.
+    """
+    global async_calls
+    async_calls.close()
+    async_calls = AsyncCallsQueue(persistent=persistent)
+
+
+def schedule_deferred_save(async_request: AsyncRequest) -> int:
+    """Schedules a deferred (overlapped with training) save on the module-level queue.
+
+    Blocks until all *previously* scheduled deferred saves are finalized, then
+    schedules `async_request` in the background. Note that any completion marker
+    (e.g. `metadata.json`) must be part of `async_request.finalize_fns`, so that
+    a crash before finalization leaves the checkpoint marked as incomplete
+    rather than complete but unreadable.
+
+    This function must be called on all ranks.
+
+    Args:
+        async_request (AsyncRequest): async save request to schedule.
+
+    Returns:
+        int: index of the scheduled async call.
+    """
+    async_calls.barrier_previous()
+    return async_calls.schedule_async_request(async_request)
+
+
+def maybe_finalize_deferred_saves(blocking: bool = False) -> List[int]:
+    """Finalizes saves scheduled with `schedule_deferred_save`.
+
+    This function must be called on all ranks.
+
+    Args:
+        blocking (bool, optional): if True, waits until all deferred saves are
+            done. Defaults to False.
+
+    Returns:
+        List[int]: list of indices of async calls that have been finalized.
+    """
+    return async_calls.maybe_finalize_async_calls(blocking=blocking)
+
+
+def plan_sequential_write_order(items: List, key: Optional[Callable] = None) -> List:
+    """Orders write items so that backends emit their files sequentially.
+
+    Object stores and hierarchical-namespace filesystems penalize random write
+    order across files heavily; writing files in sorted (e.g. lexicographic or
+    offset) order converts the workload into sequential writes. Save strategy
+    implementations should iterate their per-file writes via this helper.
+
+    Args:
+        items (List): write items (e.g. per-file write buckets) to order
+        key (Callable, optional): sort key; defaults to natural item ordering
+
+    Returns:
+        List: items sorted by `key`
+    """
+    return sorted(items, key=key) if key is not None else sorted(items)
+
+
 def get_default_strategy(action: StrategyAction, backend: str, version: int):
-    """Retrieves a default strategy for a given action, backend and version."""
-    error_hint: str = ""
-    try:
-        error_hint = ' Please use PyTorch version >=2.1'
-        from .torch import register_default_torch_strategies
-
-        register_default_torch_strategies()
-    except ImportError as e:
-        raise CheckpointingException(
-            f'Cannot import a default strategy for: {(action.value, backend, version)}. '
-            f'Error: {e}. Hint: {error_hint}'
-        ) from e
-    try:
-        return default_strategies[action.value][(backend, version)]
-    except KeyError as e:
-        raise CheckpointingException(
-            f'Cannot find a default strategy for: {(action.value, backend, version)}'
-        ) from e
+    """Retrieves a default strategy for a given action, backend and version.
+
+    Returns a copy of the registered strategy: strategies can be stateful
+    (e.g. per-save plan caches) and callers configure the returned instance,
+    so handing out the registered instance would leak state between lookups.
+    """
+    registry = default_strategies[action]
+    strategy = registry.get((backend, version))
+    if strategy is None:
+        if backend not in _registered_backends:
+            error_hint: str = ""
+            try:
+                error_hint = ' Please use PyTorch version >=2.1'
+                from .torch import register_default_torch_strategies
+
+                register_default_torch_strategies()
+            except ImportError as e:
+                raise CheckpointingException(
+                    f'Cannot import a default strategy for: {(action.value, backend, version)}. '
+                    f'Error: {e}. Hint: {error_hint}'
+                ) from e
+            _registered_backends.add(backend)
+        try:
+            strategy = registry[(backend, version)]
+        except KeyError as e:
+            raise CheckpointingException(
+                f'Cannot find a default strategy for: {(action.value, backend, version)}'
+            ) from e
+    return copy.copy(strategy)
 
 
 def register_default_strategy(
@@ -61,55 +189,87 @@ def register_default_strategy(
         version (int): version that the strategy becomes a default for
         strategy (SaveStrategyBase, LoadStrategyBase): strategy to register
     """
-    default_strategies[action.value][(backend, version)] = strategy
+    default_strategies[action][(backend, version)] = strategy
+
+
+# First 4 bytes of a zstd frame (RFC 8878)
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def read_maybe_compressed(path: Union[str, Path]) -> io.BytesIO:
+    """Reads a file written via `SaveCommonStrategy._open_write` into a buffer.
 
+    Compression is sniffed from the zstd frame magic number, so both
+    uncompressed and zstd-compressed checkpoint files load transparently.
 
-class LoadStrategyBase(ABC):
+    Args:
+        path (Union[str, Path]): file to read
+
+    Returns:
+        io.BytesIO: buffer with the (decompressed) file contents
+    """
+    data = Path(path).read_bytes()
+    if data[:4] == _ZSTD_MAGIC:
+        if not HAVE_ZSTD:
+            raise CheckpointingException(
+                f'Checkpoint file {path} is zstd-compressed but zstandard is not installed,'
+                ' please install it with `pip install zstandard`'
+            )
+        data = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+    return io.BytesIO(data)
+
+
+class LoadStrategyBase:
     """Base class for a load strategy. Requires implementing checks for compatibility with a
     given checkpoint version."""
 
-    @abstractmethod
+    __slots__ = ()
+
+    # Whether this strategy can handle loading ShardedObjects. Constant per
+    # class, so a plain attribute avoids a descriptor call on every check.
+    can_handle_sharded_objects: ClassVar[bool] = False
+
     def check_backend_compatibility(self, loaded_backend):
         """Verifies if this strategy is compatible with `loaded_backend`."""
         raise NotImplementedError
 
-    @abstractmethod
     def check_version_compatibility(self, loaded_version):
         """Verifies if this strategy is compatible with `loaded_version`."""
         raise NotImplementedError
 
-    @property
-    def can_handle_sharded_objects(self):
-        """Returns whether or not this strategy can handle loading ShardedObjects."""
-        return False
-
 
-class SaveStrategyBase(ABC):
+class SaveStrategyBase:
     """Base class for a save strategy. Requires defining a backend type and
     version of the saved format."""
 
+    __slots__ = ('backend', 'version', '_str_cache')
+
     def __init__(self, backend: str, version: int):
         self.backend = backend
         self.version = version
 
-    @property
-    def can_handle_sharded_objects(self):
-        """Returns whether or not this strategy can handle saving ShardedObjects."""
-        return False
+    # Whether this strategy can handle saving ShardedObjects. Constant per
+    # class, so a plain attribute avoids a descriptor call on every check.
+    can_handle_sharded_objects: ClassVar[bool] = False
 
     def __str__(self):
-        return f'{self.__class__.__name__}({self.backend}, {self.version})'
+        # Lazily cached - log-heavy checkpoint paths stringify strategies repeatedly
+        s = getattr(self, '_str_cache', None)
+        if s is None:
+            s = f'{type(self).__name__}({self.backend}, {self.version})'
+            self._str_cache = s
+        return s
 
 
 class LoadCommonStrategy(LoadStrategyBase):
     """Load strategy for common (non-sharded) objects"""
 
-    @abstractmethod
+    __slots__ = ()
+
     def load_common(self, checkpoint_dir: Union[str, Path]):
         """Load common part of the checkpoint."""
         raise NotImplementedError
 
-    @abstractmethod
     def load_sharded_objects(
         self, sharded_objects_state_dict: ShardedStateDict, checkpoint_dir: Union[str, Path]
     ):
@@ -126,12 +286,12 @@ class LoadCommonStrategy(LoadStrategyBase):
 class LoadShardedStrategy(LoadStrategyBase):
     """Load strategy for sharded tensors"""
 
-    @abstractmethod
+    __slots__ = ()
+
     def load(self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Union[str, Path]):
         """Load the sharded part of the checkpoint."""
         raise NotImplementedError
 
-    @abstractmethod
     def load_tensors_metadata(self, checkpoint_dir: Union[str, Path]):
         """Load tensors metadata from the checkpoint for ShardedTensors.
 
@@ -161,15 +321,95 @@ class LoadShardedStrategy(LoadStrategyBase):
             f'Loading only sharded metadata not implemented for {self.__class__.__name__}'
         )
 
+    def load_sharded_metadata_batch(
+        self, checkpoint_dir: Union[str, Path], keys: List[str]
+    ) -> ShardedStateDict:
+        """Load metadata for multiple sharded keys with a single storage query.
+
+        The default implementation performs one `load_sharded_metadata` scan and
+        selects the requested keys from its result, so querying N keys costs one
+        checkpoint traversal instead of N. Backends that can answer the query
+        more cheaply (e.g. with a single metadata file read) may override it.
+
+        Args:
+            checkpoint_dir (Union[str, Path]): checkpoint directory
+            keys (List[str]): sharded keys to load the metadata for
+
+        Returns:
+            ShardedStateDict: maps each requested key to a ShardedTensor or
+                ShardedObject without any data (or None if the key is missing
+                from the checkpoint).
+        """
+        sharded_metadata = self.load_sharded_metadata(checkpoint_dir)
+        return {key: sharded_metadata.get(key) for key in keys}
+
     def remove_sharded_tensors(self, checkpoint_dir: Union[str, Path], key_prefix: str):
-        """Remove all tensors whose key starts with key_prefix"""
-        raise NotImplementedError
+        """Remove all tensors whose key starts with key_prefix.
+
+        The default implementation lists the checkpoint directory once and
+        unlinks the matching entries in parallel, avoiding per-key metadata
+        round-trips on network filesystems. An entry matches only if the
+        prefix ends at a non-alphanumeric boundary in its name, so e.g.
+        `key_prefix='layer.1'` removes `layer.1.weight.pt` but not
+        `layer.10.weight.pt`. This assumes file names are prefixed with the
+        sharded keys; backends with a different layout or with separate
+        checkpoint metadata (e.g. torch_dist) must override this method.
+        """
+
+        def _matches(name: str) -> bool:
+            if not name.startswith(key_prefix):
+                return False
+            return len(name) == len(key_prefix) or not name[len(key_prefix)].isalnum()
+
+        with os.scandir(checkpoint_dir) as dir_it:
+            entries = [entry for entry in dir_it if _matches(entry.name)]
+
+        def _remove(entry):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            list(pool.map(_remove, entries))
 
 
 class SaveCommonStrategy(SaveStrategyBase):
-    """Save strategy for common (non-sharded) objects"""
+    """Save strategy for common (non-sharded) objects
+
+    Args:
+        backend (str): format backend string
+        version (int): format version
+        compression (str, optional): if 'zstd', files written through
+            `_open_write` are compressed with a streaming zstd encoder
+            (level 1, multi-threaded, so compression stays off the critical
+            path). Defaults to None (no compression).
+    """
+
+    __slots__ = ('compression',)
+
+    def __init__(self, backend: str, version: int, compression: Optional[str] = None):
+        super().__init__(backend, version)
+        if compression is not None and compression != 'zstd':
+            raise CheckpointingException(f'Unsupported compression: {compression}')
+        if compression == 'zstd' and not HAVE_ZSTD:
+            raise CheckpointingException(
+                'zstandard is not installed, please install it with `pip install zstandard`'
+            )
+        self.compression = compression
+
+    def _open_write(self, path: Union[str, Path]):
+        """Opens `path` for writing, honoring the configured compression.
+
+        Returns a binary stream; with 'zstd' compression the stream is a
+        `ZstdCompressor.stream_writer` wrapping the file. Files written through
+        this helper can be read back with `read_maybe_compressed`.
+        """
+        stream = open(path, 'wb')
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=1, threads=-1).stream_writer(stream)
+        return stream
 
-    @abstractmethod
     def save_common(self, common_state_dict: StateDict, checkpoint_dir: Union[str, Path]):
         """Save common part of the state dict."""
         raise NotImplementedError
@@ -180,28 +420,76 @@ class SaveCommonStrategy(SaveStrategyBase):
         """Save sharded objects from the state dict."""
         raise NotImplementedError
 
+    def _save_common_via_buffer(self, obj: Any, path: Union[str, Path]):
+        """Serialize `obj` in memory, then persist it with a single bulk write.
+
+        `torch.save` directly to a file stream issues many small writes and tops
+        out well below disk bandwidth; serializing to a `BytesIO` first replaces
+        them with one large write. Implementations should prefer this helper
+        over per-object writes.
+
+        Args:
+            obj: object to serialize with `torch.save`
+            path (Union[str, Path]): target file path
+        """
+        buffer = io.BytesIO()
+        torch.save(obj, buffer)
+        if self.compression is not None:
+            with self._open_write(path) as stream:
+                stream.write(buffer.getbuffer())
+        else:
+            Path(path).write_bytes(buffer.getbuffer())
+
 
 class SaveShardedStrategy(SaveStrategyBase):
     """Save strategy for sharded tensors"""
 
-    @abstractmethod
+    __slots__ = ()
+
     def save(self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Union[str, Path]):
-        """Save the sharded part of the state dict."""
+        """Save the sharded part of the state dict.
+
+        Implementations should write their output files in the order given by
+        `plan_sequential_write_order` to avoid random write order on object
+        stores, and coalesce the byte ranges of each file into a single
+        `write_vectored` call instead of issuing many small writes.
+        """
         raise NotImplementedError
 
 
 class AsyncSaveShardedStrategy(SaveShardedStrategy):
     """Save strategy suitable for async save."""
 
-    @abstractmethod
+    __slots__ = ()
+
+    # When True, `dist_checkpointing.save` turns a sync save into a background
+    # write: it returns the async request (with the completion marker in its
+    # finalization) and the caller appends its own finalizations and schedules
+    # the request with `schedule_deferred_save`, blocking only until the
+    # *previous* checkpoint is flushed. Opt in by setting the attribute on a
+    # concrete strategy instance (see `--ckpt-deferred-flush`).
+    deferred_flush: bool = False
+
     def async_save(
-        self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Union[str, Path]
+        self,
+        sharded_state_dict: ShardedStateDict,
+        checkpoint_dir: Union[str, Path],
+        process_group: Optional[torch.distributed.ProcessGroup] = None,
     ) -> AsyncRequest:
         """Perform preparation and return an AsyncRequest to the external caller.
 
+        Implementations must guarantee that all tensor data is snapshotted no
+        later than during request scheduling (for CPU tensors this requires an
+        explicit copy, see `PinnedStager.stage`), so that the training loop can
+        safely mutate the source tensors once `schedule_async_request` returns.
+
         Args:
             sharded_state_dict (ShardedStateDict): sharded state dict to save
             checkpoint_dir (Path): checkpoint target directory
+            process_group (torch.distributed.ProcessGroup, optional): process group
+                to use for the collectives issued during save planning and
+                finalization. Implementations must thread it into all their
+                collective calls. Defaults to the default process group.
 
         Returns:
             AsyncRequest: represents the async save function and finalization function.
@@ -209,8 +497,14 @@ class AsyncSaveShardedStrategy(SaveShardedStrategy):
         """
         raise NotImplementedError
 
-    def save(self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Union[str, Path]):
+    def save(
+        self,
+        sharded_state_dict: ShardedStateDict,
+        checkpoint_dir: Union[str, Path],
+        process_group: Optional[torch.distributed.ProcessGroup] = None,
+    ):
         """Each async strategy can be trivially used as a sync strategy."""
-        async_request = self.async_save(sharded_state_dict, checkpoint_dir)
+        async_request = self.async_save(
+            sharded_state_dict, checkpoint_dir, process_group=process_group
+        )
         async_request.execute_sync()
-        del async_request
@@ -13,6 +13,7 @@ from megatron.core.dist_checkpointing.mapping import ShardedStateDict, StateDict
 from megatron.core.dist_checkpointing.strategies.base import (
     SaveCommonStrategy,
     StrategyAction,
+    read_maybe_compressed,
     register_default_strategy,
 )
 from megatron.core.msc_utils import MultiStorageClientFeature
@@ -45,7 +46,7 @@ class TorchCommonSaveStrategy(SaveCommonStrategy):
                 msc = MultiStorageClientFeature.import_package()
                 msc.torch.save(common_state_dict, path)
             else:
-                torch.save(common_state_dict, path)
+                self._save_common_via_buffer(common_state_dict, path)
 
     def save_sharded_objects(
         self, sharded_objects_state_dict: ShardedStateDict, checkpoint_dir: Union[str, Path]
@@ -63,9 +64,8 @@ class TorchCommonSaveStrategy(SaveCommonStrategy):
                     os.makedirs(parent_dir, exist_ok=True)
                     torch.save(sh_obj.data, save_path)
 
-    def can_handle_sharded_objects(self):
-        """This strategy can handle ShardedObjects."""
-        return True
+    # This strategy can handle ShardedObjects
+    can_handle_sharded_objects = True
 
 
 class TorchCommonLoadStrategy(LoadCommonStrategy):
@@ -86,7 +86,8 @@ class TorchCommonLoadStrategy(LoadCommonStrategy):
                 msc = MultiStorageClientFeature.import_package()
                 return msc.torch.load(load_path, map_location='cpu')
             else:
-                return torch.load(load_path, map_location='cpu')
+                # `read_maybe_compressed` handles files written with compression enabled
+                return torch.load(read_maybe_compressed(load_path), map_location='cpu')
         except FileNotFoundError as e:
             err_msg = f'Common file {load_path} does not exist'
             if MultiStorageClientFeature.is_enabled():
@@ -181,10 +182,8 @@ class TorchCommonLoadStrategy(LoadCommonStrategy):
                 sharded_metadata[sh_obj.unique_key] = sh_obj
         return sharded_metadata
 
-    @property
-    def can_handle_sharded_objects(self):
-        """This strategy can handle ShardedObjects."""
-        return True
+    # This strategy can handle ShardedObjects
+    can_handle_sharded_objects = True
 
     def check_backend_compatibility(self, loaded_version):
         pass
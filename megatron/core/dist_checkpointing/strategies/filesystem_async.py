@@ -33,7 +33,8 @@ from torch.distributed.checkpoint.planner import SavePlan, SavePlanner, WriteIte
 from torch.distributed.checkpoint.storage import WriteResult
 from torch.futures import Future
 
-from .async_utils import _disable_gc
+from .async_utils import _disable_gc, get_pinned_stager
+from .base import plan_sequential_write_order
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +178,9 @@ class FileSystemWriterAsync(FileSystemWriter):
                         )
                     )
 
+        # Emit files in sequential name order - object stores penalize random write order
+        self.write_buckets = plan_sequential_write_order(self.write_buckets, key=itemgetter(0))
+
         # Check if there is anything to write on this rank
         if len(self.write_buckets) > 0:
             assert len(self.write_buckets) <= self.thread_count, (
@@ -212,7 +216,11 @@ class FileSystemWriterAsync(FileSystemWriter):
     @staticmethod
     def preload_tensors(write_buckets: List[WriteBucket], non_blocking=True) -> List[WriteBucket]:
         """
-        Preloads tensors in `state_dict` to host memory via CPU memory.
+        Preloads tensors in `state_dict` to pinned host memory.
+
+        GPU tensors are staged through `PinnedStager`, which copies into pinned
+        buffers on a dedicated CUDA stream so the D2H memcpy can overlap with
+        work on the default stream.
 
         Args:
             write_buckets (List): List of `WriteBucket` objects that define what to
@@ -220,18 +228,19 @@ class FileSystemWriterAsync(FileSystemWriter):
             non_blocking (bool, optional): knob to enable pinned D2H memcpy. Default is True.
         """
         result = []
+        stager = get_pinned_stager()
 
         for bucket in write_buckets:
             file_name, storage_key, (bytes_data, tensor_data) = bucket
             tensor_list = []
             for item, tensor in tensor_data:
                 # we belive these tensors are detached from the model trainers
-                tensor_list.append((item, tensor.to("cpu", non_blocking=non_blocking)))
+                tensor_list.append((item, stager.stage(tensor, non_blocking=non_blocking)))
                 # This is required for `PersistentAsyncCaller` to remove reference
                 del tensor
             result.append((file_name, storage_key, (bytes_data, tensor_list)))
         if non_blocking:
-            torch.cuda.synchronize()
+            stager.synchronize()
         return result
 
     @staticmethod
@@ -85,16 +85,33 @@ class FullyParallelSaveStrategyWrapper(AsyncSaveShardedStrategy):
 
         self.cached_distribution: Optional[ShardDistribution] = None
 
-    def async_save(self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Path):
+    def async_save(
+        self,
+        sharded_state_dict: ShardedStateDict,
+        checkpoint_dir: Path,
+        process_group: Optional[torch.distributed.ProcessGroup] = None,
+    ):
         if not isinstance(self.base_strategy, AsyncSaveShardedStrategy):
             raise CheckpointingException(
                 f'Cannot apply async_save to non-async base strategy {self.base_strategy}'
             )
         self.apply_saving_parallelization(sharded_state_dict)
-        return self.base_strategy.async_save(sharded_state_dict, checkpoint_dir)
+        return self.base_strategy.async_save(
+            sharded_state_dict, checkpoint_dir, process_group=process_group
+        )
 
-    def save(self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Path):
+    def save(
+        self,
+        sharded_state_dict: ShardedStateDict,
+        checkpoint_dir: Path,
+        process_group: Optional[torch.distributed.ProcessGroup] = None,
+    ):
         self.apply_saving_parallelization(sharded_state_dict)
+        if process_group is not None:
+            # Custom sync base strategies may not accept the process_group kwarg
+            return self.base_strategy.save(
+                sharded_state_dict, checkpoint_dir, process_group=process_group
+            )
         return self.base_strategy.save(sharded_state_dict, checkpoint_dir)
 
     def apply_saving_parallelization(self, sharded_state_dict: ShardedStateDict) -> None:
@@ -137,6 +154,10 @@ class FullyParallelSaveStrategyWrapper(AsyncSaveShardedStrategy):
     def can_handle_sharded_objects(self):
         return self.base_strategy.can_handle_sharded_objects
 
+    @property
+    def deferred_flush(self):
+        return getattr(self.base_strategy, 'deferred_flush', False)
+
 
 class FullyParallelLoadStrategyWrapper(LoadShardedStrategy):
     """Wraps arbitrary load strategy and distributes the load during `load`.
@@ -641,13 +641,19 @@ class TorchDistSaveShardedStrategy(AsyncSaveShardedStrategy):
         self.validated_loaded_metadata_reuse = False
 
     def async_save(
-        self, sharded_state_dict: ShardedStateDict, checkpoint_dir: Path
+        self,
+        sharded_state_dict: ShardedStateDict,
+        checkpoint_dir: Path,
+        process_group: Optional[torch.distributed.ProcessGroup] = None,
     ) -> AsyncRequest:
         """Translates MCore ShardedTensors to PyT ShardedTensors & saves in PyT Distributed format.
 
         Args:
             sharded_state_dict (ShardedStateDict): sharded state dict to save
             checkpoint_dir (Path): checkpoint directory
+            process_group (torch.distributed.ProcessGroup, optional): process group
+                used for the save planning and finalization collectives.
+                Defaults to the default process group.
 
         Returns: None
         """
@@ -669,7 +675,7 @@ class TorchDistSaveShardedStrategy(AsyncSaveShardedStrategy):
             thread_count=self.thread_count,
             use_msc=MultiStorageClientFeature.is_enabled(),
         )
-        # This should be set differently if we run in a smaller process group than the default
+        # Coordinator rank relative to `process_group` (the default group if None)
         coordinator = 0
         # Try twice to validate the generated `central_plan` is the same across iterations
         # If so, reuse `cached_central_plan` and `cached_global_metadata`
@@ -699,7 +705,7 @@ class TorchDistSaveShardedStrategy(AsyncSaveShardedStrategy):
         ) = save_state_dict_async_plan(
             pyt_state_dict,
             writer,
-            None,
+            process_group,
             coordinator,
             # flatten_sharded_tensors=False: MCore doesn't use nested ShardedTensors (FSDP 2D),
             # so skip the expensive traverse_state_dict copy in _flatten_sharded_tensors
@@ -711,7 +717,7 @@ class TorchDistSaveShardedStrategy(AsyncSaveShardedStrategy):
             cached_ckpt_structure=args_cached_plans,
             loaded_all_plans=loaded_all_plans,
         )
-        rank = torch.distributed.get_rank()
+        rank = torch.distributed.get_rank(process_group)
         if self.use_cached_ckpt_structure:
             if (
                 loaded_all_plans
@@ -751,8 +757,7 @@ class TorchDistSaveShardedStrategy(AsyncSaveShardedStrategy):
 
         return AsyncRequest(save_fn, save_args, [finalize_fn], preload_fn=preload_fn)
 
-    def can_handle_sharded_objects(self):
-        return True
+    can_handle_sharded_objects = True
 
 
 def _get_filesystem_reader(
@@ -947,8 +952,7 @@ class TorchDistLoadShardedStrategy(LoadShardedStrategy):
         else:
             fs_writer.fs.rm_file(old_path)
 
-    def can_handle_sharded_objects(self):
-        return True
+    can_handle_sharded_objects = True
 
     def check_backend_compatibility(self, loaded_version):
         pass  # TODO
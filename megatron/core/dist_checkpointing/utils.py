@@ -2,9 +2,10 @@
 
 """ Helpers for manipulating sharded tensors and sharded state dicts. """
 import logging
+import os
 from contextlib import contextmanager
 from time import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .dict_utils import dict_list_map_inplace, extract_matching_values, nested_values
 from .mapping import (
@@ -34,6 +35,26 @@ def zip_strict(*args):
     return zip(*args)
 
 
+def write_vectored(fd: int, buffers: List, offset: int = 0) -> int:
+    """Writes multiple buffers to a file descriptor with a single syscall.
+
+    Coalescing per-shard byte ranges into one `os.pwritev` call avoids the
+    per-write syscall and small-write overhead that keeps naive writers well
+    below disk bandwidth. This is the recommended write primitive for
+    checkpoint writer threads.
+
+    Args:
+        fd (int): file descriptor opened for writing
+        buffers (List): bytes-like objects to write back-to-back
+        offset (int, optional): file offset to write at. Defaults to 0.
+
+    Returns:
+        int: total number of bytes written
+    """
+    views = [memoryview(b).cast('B') for b in buffers]
+    return os.pwritev(fd, views, offset)
+
+
 def _sharded_tensor_shard_id(sharded_tensor: ShardedTensor) -> _ShardId:
     """Unique id of the sharded tensor data.
 
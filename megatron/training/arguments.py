@@ -1391,7 +1391,15 @@ def validate_args(args, defaults={}):
                 'Disabling --async-save.'
             )
             args.async_save = False
-        
+
+    if args.ckpt_deferred_flush:
+        if args.async_save:
+            warn_rank_0('--ckpt-deferred-flush has no effect with --async-save. Disabling it.')
+            args.ckpt_deferred_flush = False
+        elif args.ckpt_format != 'torch_dist':
+            raise RuntimeError('--ckpt-deferred-flush is only supported with '
+                               '--ckpt-format torch_dist.')
+
     # Inference args
     if args.inference_batch_times_seqlen_threshold > -1:
         assert args.pipeline_model_parallel_size > 1, \
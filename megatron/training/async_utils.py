@@ -7,6 +7,7 @@ the async checkpoint save calls.
 import logging
 
 from megatron.core.dist_checkpointing.strategies.async_utils import AsyncCallsQueue, AsyncRequest
+from megatron.core.dist_checkpointing.strategies.base import maybe_finalize_deferred_saves
 from megatron.core.dist_checkpointing.strategies.filesystem_async import _results_queue
 from megatron.training import get_args
 from megatron.training.utils import print_rank_0
@@ -45,6 +46,10 @@ def maybe_finalize_async_save(blocking: bool = False, terminate=False):
                 be closed as the last action of this function.
     """
     args = get_args()
+    if getattr(args, 'ckpt_deferred_flush', False):
+        # Deferred sync saves are scheduled on the dist_checkpointing module-level
+        # queue (see `schedule_deferred_save`) and drained here
+        maybe_finalize_deferred_saves(blocking=blocking)
     if not args.async_save:
         return
 
@@ -24,6 +24,7 @@ from torch.distributed.checkpoint import FileSystemReader, default_planner
 from megatron.core import dist_checkpointing, mpu, tensor_parallel
 from megatron.core.dist_checkpointing.mapping import ShardedObject
 from megatron.core.dist_checkpointing.serialization import get_default_load_sharded_strategy
+from megatron.core.dist_checkpointing.strategies.base import schedule_deferred_save
 from megatron.core.dist_checkpointing.strategies.fully_parallel import (
     FullyParallelLoadStrategyWrapper,
     FullyParallelSaveStrategyWrapper,
@@ -614,6 +615,10 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
             else:
                 validate_sharding_integrity = True
                 save_strategy = get_default_save_sharded_strategy(args.ckpt_format)
+                if getattr(args, 'ckpt_deferred_flush', False) and not args.async_save:
+                    # Sync saves overlap flushing with training; pending writes are
+                    # finalized in maybe_finalize_async_save / at the next save
+                    save_strategy.deferred_flush = True
                 if args.ckpt_assume_constant_structure and args.ckpt_format == 'torch_dist':
                     save_strategy.use_cached_ckpt_structure = args.ckpt_assume_constant_structure
                     if args.async_save:
@@ -704,8 +709,13 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
                 ensure_directory_exists(checkpoint_name)
                 torch.save(state_dict, checkpoint_name)
     start_misc = time()
+    # A deferred-flush sync save returns an async request just like --async-save:
+    # the tracker file and success callbacks below must ride on that request so
+    # a crash mid-flush cannot leave the tracker pointing at an incomplete
+    # checkpoint
+    deferred_save = not args.async_save and async_save_request is not None
     if ckpt_type != CheckpointType.LOCAL:
-        if not args.async_save:
+        if not args.async_save and not deferred_save:
             assert async_save_request is None
             # Wait so everyone is done (necessary)
             if torch.distributed.is_initialized():
@@ -771,7 +781,7 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
                             # Asynchronous version of delete_checkpoint(args, iteration_to_delete=prev_iteration).
                             threading.Thread(target=delete_checkpoint, args=(args, prev_iteration,)).start()
 
-        if args.async_save:
+        if args.async_save or deferred_save:
             assert async_save_request is not None
             async_save_request.add_finalize_fn(iter_finalize_fn)
         else:
@@ -782,7 +792,7 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
        or is_last_rank():
         def onelogger_finalize_fn():
             on_save_checkpoint_success(productive_metrics, args.async_save)
-        if args.async_save:
+        if args.async_save or deferred_save:
             assert async_save_request is not None
             async_save_request.add_finalize_fn(onelogger_finalize_fn)
         else:
@@ -793,7 +803,7 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
        or is_last_rank():
         def wandb_finalize_fn():
             wandb_utils.on_save_checkpoint_success(checkpoint_name, get_checkpoint_tracker_filename(save_dir), save_dir, iteration)
-        if args.async_save:
+        if args.async_save or deferred_save:
             assert async_save_request is not None
             async_save_request.add_finalize_fn(wandb_finalize_fn)
         else:
@@ -803,6 +813,10 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
         schedule_async_save(async_save_request)
         print_rank_0(f"  [{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}] scheduled "
                      f"an async checkpoint save at iteration {iteration:7d} to {save_dir}")
+    elif deferred_save:
+        schedule_deferred_save(async_save_request)
+        print_rank_0(f"  [{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}] scheduled "
+                     f"a deferred checkpoint flush at iteration {iteration:7d} to {save_dir}")
 
     # Wait so everyone is done (not necessary)
     if torch.distributed.is_initialized():
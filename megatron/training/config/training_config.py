@@ -441,6 +441,12 @@ class CheckpointConfig:
     async_save: bool = False
     """Apply async checkpointing save. Currently works only with `torch_dist` distributed checkpoint format."""
 
+    ckpt_deferred_flush: bool = False
+    """Overlap synchronous checkpoint save flushing with training: a save blocks only until the
+    previous checkpoint is flushed and the current write is finalized in the background (no later
+    than at the next save). Works only with the `torch_dist` checkpoint format and is ignored
+    when async_save is enabled."""
+
     use_persistent_ckpt_worker: bool = False
     """Use a persistent background worker for async checkpoint saves. When enabled, creates a dedicated
     worker thread/process for handling async saves. When disabled, uses temporal workers that are
@@ -1,4 +1,6 @@
 # Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+import os
+from functools import partial
 from unittest import mock
 
 import pytest
@@ -7,7 +9,7 @@ from torch.distributed.checkpoint import CheckpointException
 
 from megatron.core.dist_checkpointing import ShardedTensor, load, save
 from megatron.core.dist_checkpointing.dict_utils import diff
-from megatron.core.dist_checkpointing.strategies.async_utils import AsyncCallsQueue
+from megatron.core.dist_checkpointing.strategies.async_utils import AsyncCallsQueue, AsyncRequest
 from megatron.core.dist_checkpointing.strategies.filesystem_async import FileSystemWriterAsync
 from megatron.core.dist_checkpointing.strategies.torch import TorchDistSaveShardedStrategy
 from tests.unit_tests.dist_checkpointing import TempNamedDir
@@ -29,6 +31,12 @@ def write_data_os_err_mock_fn(
     count_queue.task_done()
 
 
+def write_marker_file(path, payload):
+    """Minimal picklable async_fn following the (target, write data) convention"""
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
 class TestAsyncSave:
     def setup_method(self, method):
         pass
@@ -74,6 +82,37 @@ class TestAsyncSave:
 
         Utils.destroy_model_parallel()
 
+    @pytest.mark.parametrize('persistent', [True, False])
+    def test_schedule_async_request_batch(self, tmp_path_dist_ckpt, persistent):
+        Utils.initialize_model_parallel(2, 4)
+        finalized = []
+
+        with TempNamedDir(tmp_path_dist_ckpt / 'test_async_batch', sync=True) as ckpt_dir:
+            path_a = os.path.join(ckpt_dir, f'marker_a_{Utils.rank}')
+            path_b = os.path.join(ckpt_dir, f'marker_b_{Utils.rank}')
+            req_a = AsyncRequest(
+                write_marker_file, (path_a, b'payload_a'), [partial(finalized.append, 'a')]
+            )
+            req_b = AsyncRequest(
+                write_marker_file, (path_b, b'payload_b'), [partial(finalized.append, 'b')]
+            )
+
+            async_calls = AsyncCallsQueue(persistent)
+            # The whole batch shares a single async call
+            call_idx = async_calls.schedule_async_request_batch([req_a, req_b])
+            assert call_idx == 0
+            assert async_calls.maybe_finalize_async_calls(blocking=True) == [0]
+            async_calls.close()
+
+            # Finalization functions of the batch run in request order
+            assert finalized == ['a', 'b']
+            with open(path_a, 'rb') as f:
+                assert f.read() == b'payload_a'
+            with open(path_b, 'rb') as f:
+                assert f.read() == b'payload_b'
+
+        Utils.destroy_model_parallel()
+
     @pytest.mark.parametrize('async_save', [False, True])
     @pytest.mark.parametrize('worker_fn', [write_data_os_err_mock_fn])
     def test_errors_are_reported(self, tmp_path_dist_ckpt, async_save, worker_fn):
@@ -34,6 +34,7 @@ from megatron.core.dist_checkpointing.serialization import (
     load_tensors_metadata,
 )
 from megatron.core.dist_checkpointing.strategies.base import StrategyAction, get_default_strategy
+from megatron.core.dist_checkpointing.strategies.common import TorchCommonSaveStrategy
 from megatron.core.dist_checkpointing.strategies.torch import TorchDistSaveShardedStrategy
 from megatron.core.dist_checkpointing.validation import StrictHandling
 from megatron.core.utils import is_torch_min_version
@@ -119,6 +120,40 @@ class TestSerialization:
 
         Utils.destroy_model_parallel()
 
+    def test_zstd_compressed_common_save_load(self, tmp_path_dist_ckpt):
+        pytest.importorskip('zstandard')
+        Utils.initialize_model_parallel(1, 1)
+
+        state_dict = {
+            'sd_keyA': ShardedTensor.from_rank_offsets(
+                'keyA', torch.ones(2, 4), replica_id=Utils.rank
+            ),
+            'lr': 0.01,
+            'step': 1000,
+        }
+        common_strategy = TorchCommonSaveStrategy('torch', 1, compression='zstd')
+
+        # sync=True to make sure other ranks wait for rank 0 to finish creating directory.
+        with TempNamedDir(tmp_path_dist_ckpt / 'test_zstd_common', sync=True) as ckpt_dir:
+            save(state_dict, ckpt_dir, common_strategy=common_strategy)
+            torch.distributed.barrier()
+
+            # The common file must actually be zstd-compressed on disk
+            with open(ckpt_dir / 'common.pt', 'rb') as f:
+                assert f.read(4) == b'\x28\xb5\x2f\xfd'
+
+            load_ssd = {
+                'load_sd_keyA': ShardedTensor.from_rank_offsets(
+                    'keyA', torch.ones(2, 4), replica_id=Utils.rank
+                )
+            }
+            loaded_state_dict = load(load_ssd, ckpt_dir)
+            assert loaded_state_dict['lr'] == 0.01
+            assert loaded_state_dict['step'] == 1000
+            assert torch.all(loaded_state_dict['load_sd_keyA'] == 1)
+
+        Utils.destroy_model_parallel()
+
     def test_multi_process_save_log_difference(self, tmp_path_dist_ckpt, caplog):
         Utils.initialize_model_parallel(2, 4)
         rank = Utils.rank
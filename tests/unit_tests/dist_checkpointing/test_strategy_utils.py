@@ -0,0 +1,177 @@
+# Copyright (c) 2025, NVIDIA CORPORATION. All rights reserved.
+
+import os
+import pickle
+from functools import partial
+from operator import itemgetter
+
+import pytest
+import torch
+
+from megatron.core.dist_checkpointing.core import CheckpointingException
+from megatron.core.dist_checkpointing.strategies.async_utils import (
+    AsyncRequest,
+    merge_async_requests,
+)
+from megatron.core.dist_checkpointing.strategies.base import (
+    LoadShardedStrategy,
+    SaveCommonStrategy,
+    StrategyAction,
+    get_default_strategy,
+    plan_sequential_write_order,
+)
+from megatron.core.dist_checkpointing.utils import write_vectored
+
+_CALLS = []
+
+
+def _record_call(tag, payload=None):
+    _CALLS.append((tag, payload))
+
+
+def _preload_a():
+    return 'staged_a'
+
+
+class _MetadataOnlyLoadStrategy(LoadShardedStrategy):
+    """Load strategy stub exercising the `LoadShardedStrategy` default methods."""
+
+    def __init__(self, sharded_metadata=None):
+        self._sharded_metadata = sharded_metadata or {}
+
+    def load_sharded_metadata(self, checkpoint_dir):
+        return self._sharded_metadata
+
+    def check_backend_compatibility(self, loaded_backend):
+        pass
+
+    def check_version_compatibility(self, loaded_version):
+        pass
+
+
+class TestMergeAsyncRequests:
+    def test_single_request_passthrough(self):
+        req = AsyncRequest(None, (), [])
+        assert merge_async_requests([req]) is req
+
+    def test_merge_executes_in_order_and_threads_kwargs(self):
+        _CALLS.clear()
+        req_a = AsyncRequest(_record_call, ('a', 'data_a'), [])
+        req_b = AsyncRequest(_record_call, ('b',), [], async_fn_kwargs={'payload': 'kw_b'})
+        merged = merge_async_requests([req_a, req_b])
+        merged.async_fn(*merged.async_fn_args, **merged.async_fn_kwargs)
+        assert _CALLS == [('a', 'data_a'), ('b', 'kw_b')]
+
+    def test_merge_replaces_staged_args_with_preload_results(self):
+        _CALLS.clear()
+        req_a = AsyncRequest(_record_call, ('a', 'gpu_a'), [], preload_fn=_preload_a)
+        req_b = AsyncRequest(_record_call, ('b', 'cpu_b'), [])
+        merged = merge_async_requests([req_a, req_b])
+        assert merged.preload_fn is not None
+        # By the `AsyncRequest` convention the 2nd arg holds the write data and
+        # is replaced with the preload result at schedule time
+        args = list(merged.async_fn_args)
+        args[1] = merged.preload_fn()
+        merged.async_fn(*args)
+        assert _CALLS == [('a', 'staged_a'), ('b', 'cpu_b')]
+
+    def test_merge_concatenates_finalize_fns_and_skips_noop_fns(self):
+        _CALLS.clear()
+        finalized = []
+        reqs = [
+            AsyncRequest(None, (), [partial(finalized.append, 1)]),
+            AsyncRequest(
+                _record_call, ('c', None), [partial(finalized.append, 2), partial(finalized.append, 3)]
+            ),
+        ]
+        merged = merge_async_requests(reqs)
+        for finalize_fn in merged.finalize_fns:
+            finalize_fn()
+        assert finalized == [1, 2, 3]
+        # noop requests contribute finalize fns only, not async execution
+        async_fns, _, _ = merged.async_fn_args
+        assert async_fns == [_record_call]
+
+    def test_merge_of_noop_requests_is_noop(self):
+        merged = merge_async_requests([AsyncRequest(None, (), []), AsyncRequest(None, (), [])])
+        assert merged.async_fn is None
+
+    def test_merged_request_is_picklable(self):
+        # The merged request travels to the spawn-based persistent worker
+        req_a = AsyncRequest(_record_call, ('a', 'gpu_a'), [], preload_fn=_preload_a)
+        req_b = AsyncRequest(_record_call, ('b', 'cpu_b'), [])
+        merged = merge_async_requests([req_a, req_b])
+        # finalize_fns are stripped before scheduling, as in AsyncCallsQueue
+        reloaded = pickle.loads(pickle.dumps(merged._replace(finalize_fns=[])))
+        assert reloaded.preload_fn() == ['staged_a', 'cpu_b']
+
+
+class TestWriteHelpers:
+    def test_plan_sequential_write_order(self):
+        assert plan_sequential_write_order(['b', 'a', 'c']) == ['a', 'b', 'c']
+        items = [('b', 1), ('a', 2)]
+        assert plan_sequential_write_order(items, key=itemgetter(0)) == [('a', 2), ('b', 1)]
+
+    def test_write_vectored(self, tmp_path):
+        path = tmp_path / 'out.bin'
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            written = write_vectored(fd, [b'abc', bytearray(b'def'), memoryview(b'gh')])
+        finally:
+            os.close(fd)
+        assert written == 8
+        assert path.read_bytes() == b'abcdefgh'
+
+    def test_save_common_via_buffer_roundtrip(self, tmp_path):
+        strategy = SaveCommonStrategy('torch', 1)
+        path = tmp_path / 'common.pt'
+        strategy._save_common_via_buffer({'a': torch.ones(2), 'b': 3}, path)
+        loaded = torch.load(path)
+        assert loaded['b'] == 3
+        assert torch.all(loaded['a'] == 1)
+
+    def test_unsupported_compression_is_rejected(self):
+        with pytest.raises(CheckpointingException):
+            SaveCommonStrategy('torch', 1, compression='gzip')
+
+
+class TestLoadShardedStrategyDefaults:
+    def test_load_sharded_metadata_batch(self):
+        strategy = _MetadataOnlyLoadStrategy({'a': 1, 'b': 2})
+        batch = strategy.load_sharded_metadata_batch('/unused', ['a', 'missing'])
+        assert batch == {'a': 1, 'missing': None}
+
+    def test_remove_sharded_tensors(self, tmp_path):
+        (tmp_path / 'layer.1.weight.pt').write_bytes(b'x')
+        (tmp_path / 'layer.10.weight.pt').write_bytes(b'x')
+        (tmp_path / 'layer.1').mkdir()
+        (tmp_path / 'layer.1' / 'shard_0_1.pt').write_bytes(b'x')
+        (tmp_path / 'other.pt').write_bytes(b'x')
+
+        _MetadataOnlyLoadStrategy().remove_sharded_tensors(tmp_path, 'layer.1')
+
+        # 'layer.10*' must survive removal of the 'layer.1' prefix
+        remaining = sorted(p.name for p in tmp_path.iterdir())
+        assert remaining == ['layer.10.weight.pt', 'other.pt']
+
+
+class TestDefaultStrategyRegistry:
+    def test_lookup_returns_fresh_instances(self):
+        strategy = get_default_strategy(StrategyAction.SAVE_SHARDED, 'torch_dist', 1)
+        assert strategy is not get_default_strategy(StrategyAction.SAVE_SHARDED, 'torch_dist', 1)
+        # per-save caches must not leak into later lookups
+        strategy.cached_global_metadata = 'sentinel'
+        fresh = get_default_strategy(StrategyAction.SAVE_SHARDED, 'torch_dist', 1)
+        assert fresh.cached_global_metadata is None
+
+    def test_unknown_strategy_raises(self):
+        with pytest.raises(CheckpointingException):
+            get_default_strategy(StrategyAction.SAVE_SHARDED, 'torch_dist', 999)
+
+
+class TestStrategyAction:
+    def test_legacy_string_api(self):
+        assert StrategyAction('load_common') is StrategyAction.LOAD_COMMON
+        assert StrategyAction(3) is StrategyAction.SAVE_SHARDED
+        assert StrategyAction.LOAD_COMMON.value == 'load_common'
+        assert str(StrategyAction.SAVE_SHARDED) == 'StrategyAction.SAVE_SHARDED'